@@ -1,10 +1,66 @@
 import re
-from pyxdameraulevenshtein import damerau_levenshtein_distance
+import sys
+
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import DamerauLevenshtein
+
+_PUNCT_TABLE = str.maketrans('', '', '",.!\':;')  # Punctuation stripped from every corpus line
+
+# Matches either a whole '<err targ=correct> incorrect </err>' block or a single regular word.
+# The correct word is the token after 'targ=' with its closing '>' chopped off.
+_TOKEN_RE = re.compile(r'<err\s+targ=(\S*)\S(.*?)\s</err>(?!\S)|(\S+)')
+
+
+def _is_ascii_alpha(word):
+    """
+    Checks that a word consists only of the letters a-z / A-Z (the empty word passes too).
+
+    Parameters:
+    - word (str): The word to check.
+
+    Returns:
+    - bool: True if the word contains no numerics/punctuation, otherwise False.
+    """
+    return not word or (word.isascii() and word.isalpha())
+
+
+def _is_alpha_pair(word, error):
+    """
+    Checks that neither the correct word nor the error word contains numerics/punctuation.
+
+    Parameters:
+    - word (str): The correct word.
+    - error (str): The error word.
+
+    Returns:
+    - bool: True if both words consist only of the letters a-z / A-Z, otherwise False.
+    """
+    return _is_ascii_alpha(word) and _is_ascii_alpha(error)
+
+
+def _format_entry(word, error):
+    """
+    Formats a correct word and its optional error as 'word (error)?'.
+
+    Parameters:
+    - word (str): The correct word.
+    - error (str): The error word, or an empty string if there is none.
+
+    Returns:
+    - str: The formatted entry.
+    """
+    rep = word
+    if error:
+        rep = rep + " (" + error + ")"
+    return rep
 
 
 class LexicalEntry:
     """LexicalEntry class represents a unit of information about a word and its potential error."""
 
+    __slots__ = ('word', 'error')
+
     def __init__(self, word='', error=''):
         """
         Initializes a LexicalEntry object with a correct 'word' and an optional 'error' word.
@@ -34,10 +90,7 @@ class LexicalEntry:
         Returns:
         - bool: True if the LexicalEntry object has an error, otherwise False.
         """
-        if self.error:
-            return True
-        else:
-            return False
+        return bool(self.error)
 
     # Method to check if the error is within edit distance one and contains no numerics/punctuation
     def isValidTest(self):
@@ -49,14 +102,18 @@ class LexicalEntry:
         - bool: True if the error is within edit distance one and contains no numerics/punctuation,
                 otherwise False.
         """
-        if not self.hasError():
+        if not self.error:
             return False
-        # Calculate the Damerau-Levenshtein distance between the correct word and the error word
-        distance = damerau_levenshtein_distance(self.word, self.error)
-        if distance > 1:
+        # Reject numerics/punctuation before the edit distance, it is far cheaper
+        if not _is_alpha_pair(self.word, self.error):
             return False
-        regex = '.*[^a-zA-Z].*'  # Regular expression to match any non-alphabetic characters
-        if re.match(regex, self.word) or re.match(regex, self.error):
+        # The edit distance is at least the length difference
+        if abs(len(self.word) - len(self.error)) > 1:
+            return False
+        # Calculate the Damerau-Levenshtein distance between the correct word and the error word,
+        # stopping as soon as it is known to exceed one
+        distance = DamerauLevenshtein.distance(self.word, self.error, score_cutoff=1)
+        if distance > 1:
             return False
         return True
 
@@ -70,28 +127,62 @@ class LexicalEntry:
         Returns:
         - str: A string representation of the LexicalEntry object.
         """
-        rep = self.word
-        if self.hasError():
-            rep = rep + " (" + self.error + ")"
-        return rep
+        return _format_entry(self.word, self.error)
 
 
 class Sentence:
-    """Contains a list of LexicalEntries."""
+    """
+    Contains a sequence of LexicalEntries, stored as parallel lists of correct words and
+    error words (an empty string meaning the word has no error).
+    """
+
+    __slots__ = ('words', 'errors')
 
     def __init__(self, sentence=None):
         """
         Initializes a Sentence object with a list of LexicalEntries.
 
         Parameters:
-        - sentence (list): A list of LexicalEntries (default is an empty list if not provided).
+        - sentence (list or Sentence): A list of LexicalEntries, or a Sentence to copy (default is
+                                       an empty sentence if not provided).
         """
-        if sentence == None:
-            self.data = []
-        elif type(sentence) == list:
-            self.data = list(sentence)
+        if isinstance(sentence, Sentence):
+            self.words = list(sentence.words)
+            self.errors = list(sentence.errors)
         else:
-            self.data = list(sentence.data)
+            entries = list(sentence or ())  # Read once, so one-shot iterables work too
+            self.words = [lexical_entry.word for lexical_entry in entries]
+            self.errors = [lexical_entry.error for lexical_entry in entries]
+
+    @classmethod
+    def from_arrays(cls, words, errors):
+        """
+        Creates a Sentence that takes ownership of already built word and error lists.
+
+        Parameters:
+        - words (list): A list of strings with the correct words.
+        - errors (list): A list of strings with the error words, '' where there is no error.
+
+        Returns:
+        - Sentence: A new Sentence object backed by the given lists.
+        """
+        sentence = cls.__new__(cls)
+        sentence.words = words
+        sentence.errors = errors
+        return sentence
+
+    @property
+    def data(self):
+        """
+        Returns a read-only snapshot of the sentence as LexicalEntries, built on demand.
+
+        Changes to the returned LexicalEntries are not reflected in the sentence; use update() or
+        append() instead. Loops that only need the words should iterate 'words' directly.
+
+        Returns:
+        - tuple: A tuple of LexicalEntries.
+        """
+        return tuple(LexicalEntry(word, error) for word, error in zip(self.words, self.errors))
 
     def get_error_sentence(self):
         """
@@ -100,13 +191,7 @@ class Sentence:
         Returns:
         - list: A list of strings representing the sentence with errors.
         """
-        errorSentence = []
-        for lexical_entry in self.data:
-            if lexical_entry.hasError():
-                errorSentence.append(lexical_entry.error)
-            else:
-                errorSentence.append(lexical_entry.word)
-        return errorSentence
+        return [error if error else word for word, error in zip(self.words, self.errors)]
 
     def get_correct_sentence(self):
         """
@@ -115,10 +200,7 @@ class Sentence:
         Returns:
         - list: A list of strings representing the sentence with corrections.
         """
-        correctSentence = []
-        for lexical_entry in self.data:
-            correctSentence.append(lexical_entry.word)
-        return correctSentence
+        return list(self.words)
 
     def is_correction(self, candidate):
         """
@@ -130,12 +212,8 @@ class Sentence:
         Returns:
         - bool: True if the candidate is a correction, otherwise False.
         """
-        if len(self.data) != len(candidate):
-            return False
-        for i in range(len(self.data)):
-            if candidate[i] != self.data[i].word:
-                return False
-        return True
+        # A single C-level list comparison; interned corpus words short-circuit on identity
+        return self.words == list(candidate)
 
     def get_error_index(self):
         """
@@ -144,10 +222,7 @@ class Sentence:
         Returns:
         - int: Index of the first error or -1 if there is no error.
         """
-        for i in range(0, len(self.data)):
-            if self.data[i].hasError():
-                return i
-        return -1
+        return next((i for i, error in enumerate(self.errors) if error), -1)
 
     def get(self, i):
         """
@@ -159,7 +234,7 @@ class Sentence:
         Returns:
         - lexical_entry: The lexical_entry at the specified index.
         """
-        return self.data[i]
+        return LexicalEntry(self.words[i], self.errors[i])
 
     def update(self, i, lexical_entry):
         """
@@ -169,7 +244,8 @@ class Sentence:
         - i (int): Index of the LexicalEntry to update.
         - val (lexical_entry): New lexical_entry value.
         """
-        self.data[i] = lexical_entry
+        self.words[i] = lexical_entry.word
+        self.errors[i] = lexical_entry.error
 
     def clean_sentence(self):
         """
@@ -178,11 +254,7 @@ class Sentence:
         Returns:
         - Sentence: A new Sentence object with errors removed.
         """
-        sentence = Sentence()
-        for lexical_entry in self.data:
-            clean = lexical_entry.fixError()
-            sentence.append(clean)
-        return sentence
+        return Sentence.from_arrays(list(self.words), [''] * len(self.words))
 
     def is_empty(self):
         """
@@ -191,7 +263,7 @@ class Sentence:
         Returns:
         - bool: True if the sentence is empty, otherwise False.
         """
-        return len(self.data) == 0
+        return len(self.words) == 0
 
     def append(self, lexical_entry):
         """
@@ -200,7 +272,8 @@ class Sentence:
         Parameters:
         - item (lexical_entry): The lexical_entry to append to the sentence.
         """
-        self.data.append(lexical_entry)
+        self.words.append(lexical_entry.word)
+        self.errors.append(lexical_entry.error)
 
     def __len__(self):
         """
@@ -209,7 +282,7 @@ class Sentence:
         Returns:
         - int: The length of the sentence.
         """
-        return len(self.data)
+        return len(self.words)
 
     def __str__(self):
         """
@@ -219,11 +292,69 @@ class Sentence:
         - str: A string representation of the Sentence object.
         """
         str_list = []
-        for lexical_entry in self.data:
-            str_list.append(str(lexical_entry))
+        for word, error in zip(self.words, self.errors):
+            str_list.append(_format_entry(word, error))
         return ' '.join(str_list)
 
 
+def _parse_line(line):
+    """
+    Parses a cleaned (stripped, lowercased, punctuation-free) Corpus line into a Sentence.
+
+    Parameters:
+    - line (str): A non-empty cleaned line from the Corpus dataset.
+
+    Returns:
+    - Sentence: A Sentence wrapped in the start and end symbols.
+    """
+    # Words are interned so repeated tokens across the corpus share a single string object,
+    # and are appended straight to the Sentence's lists rather than through LexicalEntries
+    if '<err' not in line:  # Lines without error markup only need a plain split
+        words = ["<s>"] + [sys.intern(token) for token in line.split()] + ["</s>"]
+        return Sentence.from_arrays(words, [''] * len(words))
+
+    words = ["<s>"]  # Start symbol
+    errors = ['']
+
+    for match in _TOKEN_RE.finditer(line):
+        correct_token, error_block, token = match.groups()
+
+        if token is not None:  # Regular word
+            words.append(sys.intern(token))
+            errors.append('')
+            continue
+
+        incorrect_tokens = error_block.split()
+        words.append(sys.intern(correct_token))
+        if len(incorrect_tokens) == 1:
+            errors.append(incorrect_tokens[0])
+        else:  # Errors spanning several words are kept as the correct word only
+            errors.append('')
+
+    words.append("</s>")
+    errors.append('')
+    return Sentence.from_arrays(words, errors)
+
+
+def _process_line(line):
+    """
+    Processes a line from the Corpus dataset into a Sentence object.
+
+    Parameters:
+    - line (str): A line from the Corpus dataset.
+
+    Returns:
+    - Sentence: A processed Sentence object, or None if the line is empty.
+    """
+    # Stripping, lowercasing, and removing punctuation from the line
+    line = line.strip().lower().translate(_PUNCT_TABLE)
+
+    if line == '':
+        return None
+
+    return _parse_line(line)
+
+
 class Corpus:
     """
     Represents a corpus of sentences, with methods for processing and generating test cases.
@@ -250,13 +381,8 @@ class Corpus:
         Parameters:
         - filename (str): The name of the file containing the dataset.
         """
-        f = open(filename)
-        self.corpus = []
-
-        for line in f:
-            sentence = self.process_line(line)
-            if sentence:
-                self.corpus.append(sentence)
+        with open(filename, encoding='utf-8', buffering=1 << 20) as f:  # 1 MiB read buffer
+            self.corpus = [sentence for sentence in map(self.process_line, f) if sentence]
 
     def process_line(self, line):
         """
@@ -268,43 +394,7 @@ class Corpus:
         Returns:
         - Sentence: A processed Sentence object.
         """
-        # Stripping, lowercasing, and removing punctuation from the line
-        line = line.strip().lower().replace('"', '').replace(',', '').replace('.', '').replace('!', '') \
-            .replace("'", '').replace(":", '').replace(";", '')
-
-        if line == '':
-            return None
-
-        processed_tokens = Sentence()
-        processed_tokens.append(LexicalEntry("<s>"))  # Start symbol
-
-        tokens = line.split()
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-
-            if token == '<err':
-                targ = tokens[i + 1]
-                targ_splits = targ.split('=')
-                correct_token = targ_splits[1][:-1]  # Chop off the trailing '>'
-                correct_token_splits = correct_token.split()
-
-                if len(correct_token_splits) > 2:  # Target with multiple words
-                    for correct_word in correct_token_splits:
-                        processed_tokens.append(LexicalEntry(correct_word))
-                elif tokens[i + 3] != '</err>':
-                    processed_tokens.append(LexicalEntry(correct_token))
-                else:
-                    incorrect_token = tokens[i + 2]
-                    processed_tokens.append(LexicalEntry(correct_token, incorrect_token))
-
-                i += tokens[i:].index('</err>') + 1  # Update index
-            else:  # Regular word
-                processed_tokens.append(LexicalEntry(token))
-                i += 1
-
-        processed_tokens.append(LexicalEntry("</s>"))
-        return processed_tokens
+        return _process_line(line)
 
     def generate_test_cases(self):
         """
@@ -313,18 +403,38 @@ class Corpus:
         Returns:
         - list: A list of Sentences with eligible spelling errors.
         """
-        testCases = []  # List of Sentences
-
+        # Collect every error in the corpus, then filter them in stages from cheapest to most
+        # expensive: a vectorized length check, the alphabetic check, and finally all of the
+        # edit distances in a single batched call
+        error_entries = []  # (sentence, index, word, error) tuples
         for sentence in self.corpus:
-            clean_sentence = sentence.clean_sentence()
-
-            for i in range(0, len(sentence)):
-                lexical_entry_i = sentence.get(i)
-
-                if lexical_entry_i.hasError() and lexical_entry_i.isValidTest():
-                    testSentence = Sentence(clean_sentence)
-                    testSentence.update(i, lexical_entry_i)
-                    testCases.append(testSentence)
+            # Errors are sparse, so only the indices that have one are visited
+            error_entries.extend((sentence, i, sentence.words[i], error)
+                                 for i, error in enumerate(sentence.errors) if error)
+
+        # The edit distance is at least the length difference
+        word_lengths = np.fromiter((len(word) for _, _, word, _ in error_entries),
+                                   dtype=np.int32, count=len(error_entries))
+        error_lengths = np.fromiter((len(error) for _, _, _, error in error_entries),
+                                    dtype=np.int32, count=len(error_entries))
+        keep = np.abs(word_lengths - error_lengths) <= 1
+
+        candidates = [error_entry for error_entry, kept in zip(error_entries, keep.tolist())
+                      if kept and _is_alpha_pair(error_entry[2], error_entry[3])]
+
+        distances = process.cpdist([word for _, _, word, _ in candidates],
+                                   [error for _, _, _, error in candidates],
+                                   scorer=DamerauLevenshtein.distance, score_cutoff=1, workers=-1)
+
+        # A clean sentence has the same words with no errors, so each test case is a copy of the
+        # word list plus an error list that is empty everywhere except at the tested index
+        testCases = []  # List of Sentences
+        for (sentence, i, _, error), distance in zip(candidates, distances):
+            if distance > 1:
+                continue
+            test_errors = [''] * len(sentence)
+            test_errors[i] = error
+            testCases.append(Sentence.from_arrays(sentence.words.copy(), test_errors))
 
         return testCases
 
@@ -335,11 +445,7 @@ class Corpus:
         Returns:
         - set: A set containing unique words from the corpus.
         """
-        vocabulary = set()
-        for sentence in self.corpus:
-            for word in sentence.data:
-                vocabulary.add(word.word)
-        return vocabulary
+        return set().union(*(sentence.words for sentence in self.corpus))
 
     def __str__(self):
         """
@@ -355,25 +461,27 @@ class Corpus:
 
 
 class SpellingResult:
-    numCorrect = 0
-    numTotal = 0
-
-    def __init__(self):
-        self.numCorrect = 0
-        self.numTotal = 0
+    __slots__ = ('numCorrect', 'numTotal')
 
-    def __init__(self, correct, total):
+    def __init__(self, correct=0, total=0):
         self.numCorrect = correct
         self.numTotal = total
 
+    @property
+    def accuracy(self):
+        """
+        The fraction of test cases corrected, or 0.0 if there were none.
+
+        Returns:
+        - float: numCorrect / numTotal.
+        """
+        return self.numCorrect / self.numTotal if self.numTotal else 0.0
+
     def get_accuracy(self):
-        if self.numTotal == 0:
-            return 0.0
-        else:
-            return float(self.numCorrect) / self.numTotal
+        return self.accuracy
 
     def __str__(self):
-        return (f'Correct: {self.numCorrect}, Total: {self.numTotal}, Accuracy: {self.get_accuracy():.4%}')
+        return (f'Correct: {self.numCorrect}, Total: {self.numTotal}, Accuracy: {self.accuracy:.4%}')
 
 
 def group_n_words(sentence, n):
@@ -381,7 +489,7 @@ def group_n_words(sentence, n):
     Groups words in a given sentence into sets of 'n' consecutive words.
 
     Parameters:
-    - sentence (list): A list of strings representing the input sentence.
+    - sentence (list): A list of strings (or LexicalEntries) representing the input sentence.
     - n (int): The number of consecutive words to group together.
 
     Returns:
@@ -394,21 +502,9 @@ def group_n_words(sentence, n):
 
     >>> test = ['<s>', 'my', 'mum', 'goes', 'out', 'sometimes', '</s>']
     >>> print(group_n_words(test, 3))
-    ['<s> my mum goes', 'my mum goes out', 'mum goes out sometimes', 'goes out sometimes </s>']
+    ['<s> my mum', 'my mum goes', 'mum goes out', 'goes out sometimes', 'out sometimes </s>']
     """
-    output = []
-    cart = ""
-
-    for j in range(len(sentence)):
-        k = j
-        while (k < j + n and k < len(sentence)):
-            # Concatenate words with proper handling for string or object type
-            if type(sentence[k]) == str:
-                cart += sentence[k] + ' '
-            else:
-                cart += sentence[k].word + ' '
-            k += 1
-        output.append(cart.strip())
-        cart = ""
-        j -= (n - 1)
-    return output[:-(n - 1)]
+    # Resolve LexicalEntries to their words once, then join each window of 'n' words; zipping
+    # the shifted lists lets the windows be produced without any per-window slicing
+    words = [word if isinstance(word, str) else word.word for word in sentence]
+    return list(map(' '.join, zip(*[words[i:] for i in range(n)])))